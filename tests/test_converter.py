@@ -9,7 +9,9 @@ from yid_py import (
     Transform,
     create,
     to_alphanumeric,
+    to_alphanumeric_batch,
     to_numeric,
+    to_numeric_batch,
 )
 
 
@@ -39,12 +41,31 @@ class TestToAlphanumeric:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    def test_negative_number(self) -> None:
+        """Test that negative numbers raise an error."""
+        with pytest.raises(ConverterError, match="negative"):
+            to_alphanumeric(-1)
+        with pytest.raises(ConverterError, match="number: -5000$"):
+            to_alphanumeric(-5000, pad_up=3)
+
+    def test_negative_number_within_padding(self) -> None:
+        """Test that negatives the padding offset lifts to >= 0 still convert."""
+        assert to_alphanumeric(-1, pad_up=3) == "ZZ"
+        assert to_numeric("ZZ", pad_up=3) == -1
+        assert to_alphanumeric(-3844, pad_up=3) == "a"
+        assert to_numeric("a", pad_up=3) == -3844
+
     def test_with_secure_key(self) -> None:
         """Test conversion with secure key."""
         result = to_alphanumeric(12345, secure_key="my-secret")
         assert result != to_alphanumeric(12345)
         assert isinstance(result, str)
 
+    def test_secure_key_output_is_stable(self) -> None:
+        """Test that secure key output does not change between releases."""
+        assert to_alphanumeric(12345, secure_key="secret") == "UDJ"
+        assert to_alphanumeric(12345, secure_key="my-secret") == "hqj"
+
     def test_different_secure_keys_produce_different_results(self) -> None:
         """Test that different secure keys produce different outputs."""
         result1 = to_alphanumeric(12345, secure_key="key1")
@@ -133,6 +154,52 @@ class TestToNumeric:
             decoded = to_numeric(encoded, secure_key="test-key")
             assert decoded == num
 
+    def test_invalid_character(self) -> None:
+        """Test that characters outside the dictionary raise an error."""
+        with pytest.raises(ConverterError, match="Invalid character"):
+            to_numeric("dn-h")
+        with pytest.raises(ConverterError, match="Invalid character"):
+            to_numeric("-")
+
+    def test_single_characters(self) -> None:
+        """Test every single-character value with and without a key."""
+        for num in range(62):
+            assert to_numeric(to_alphanumeric(num)) == num
+            encoded = to_alphanumeric(num, secure_key="key")
+            assert len(encoded) == 1
+            assert to_numeric(encoded, secure_key="key") == num
+
+
+class TestBatch:
+    """Tests for to_alphanumeric_batch and to_numeric_batch functions."""
+
+    def test_encode_batch(self) -> None:
+        """Test batch encoding matches scalar encoding."""
+        numbers = [0, 1, 61, 62, 12345, 10**15]
+        assert to_alphanumeric_batch(numbers) == [
+            to_alphanumeric(num) for num in numbers
+        ]
+
+    def test_decode_batch(self) -> None:
+        """Test batch decoding matches scalar decoding."""
+        assert to_numeric_batch(["a", "Z", "ba", "dnh"]) == [0, 61, 62, 12345]
+
+    def test_batch_with_options(self) -> None:
+        """Test batch roundtrip with secure key, pad_up and transform."""
+        numbers = range(0, 100000, 997)
+        encoded = to_alphanumeric_batch(numbers, pad_up=3, secure_key="secret")
+        assert encoded == [
+            to_alphanumeric(num, pad_up=3, secure_key="secret") for num in numbers
+        ]
+        assert to_numeric_batch(encoded, pad_up=3, secure_key="secret") == list(numbers)
+        upper = to_alphanumeric_batch(numbers, transform=Transform.UPPER)
+        assert upper == [to_alphanumeric(num).upper() for num in numbers]
+
+    def test_empty_batch(self) -> None:
+        """Test that empty input returns an empty list."""
+        assert to_alphanumeric_batch([]) == []
+        assert to_numeric_batch([]) == []
+
 
 class TestTransformEnum:
     """Tests for Transform enum."""
@@ -183,6 +250,14 @@ class TestEncoder:
         result = enc.encode(12345)
         assert result.isupper()
 
+    def test_transform_matches_raw(self) -> None:
+        """Test that transformed output is the case-changed raw output."""
+        upper = Encoder(secure_key="secret", transform=Transform.UPPER)
+        lower = Encoder(secure_key="secret", transform=Transform.LOWER)
+        for num in [0, 61, 12345, 10**15]:
+            assert upper.encode(num) == upper.encode_raw(num).upper()
+            assert lower.encode(num) == lower.encode_raw(num).lower()
+
     def test_with_pad_up(self) -> None:
         """Test Encoder with pad_up."""
         enc = Encoder(pad_up=3)
@@ -198,6 +273,21 @@ class TestEncoder:
             decoded = enc.decode(raw)
             assert decoded == num
 
+    def test_numbers_beyond_64_bits(self) -> None:
+        """Test that numbers wider than 64 bits still convert."""
+        enc = Encoder(pad_up=4)
+        for num in [0, 2**64 - 1, 2**64, 10**30]:
+            assert enc.encode(num) == to_alphanumeric(num, pad_up=4)
+            assert enc.decode(enc.encode_raw(num)) == num
+
+    def test_invalid_transform_fails_on_encode_only(self) -> None:
+        """Test that an invalid transform only affects encode()."""
+        enc = Encoder(transform="invalid")  # type: ignore[arg-type]
+        assert enc.encode_raw(5) == "f"
+        assert enc.decode("f") == 5
+        with pytest.raises(ConverterError, match="Invalid transform type"):
+            enc.encode(5)
+
     def test_multiple_encoders_independence(self) -> None:
         """Test that multiple encoders work independently."""
         enc1 = Encoder(secure_key="key1")
@@ -259,6 +349,8 @@ class TestModuleExports:
         """Test that all expected exports are accessible."""
         assert hasattr(yid_py, "to_alphanumeric")
         assert hasattr(yid_py, "to_numeric")
+        assert hasattr(yid_py, "to_alphanumeric_batch")
+        assert hasattr(yid_py, "to_numeric_batch")
         assert hasattr(yid_py, "Transform")
         assert hasattr(yid_py, "Encoder")
         assert hasattr(yid_py, "create")
@@ -273,7 +365,58 @@ class TestPrivateFunctions:
         from yid_py.converter import _apply_transform
 
         with pytest.raises(ConverterError, match="Invalid transform type"):
-            _apply_transform("test", "invalid")  # type: ignore[arg-type]
+            _apply_transform(b"test", "invalid")  # type: ignore[arg-type]
+
+    def test_transformed_dictionaries_are_reused(self) -> None:
+        """Test that the case transform is not reapplied on every call."""
+        from yid_py.converter import _dictionary_bytes, _secure_dictionary_bytes
+
+        upper = _dictionary_bytes(None, Transform.UPPER)
+        assert upper is _dictionary_bytes(None, Transform.UPPER)
+        assert upper == _dictionary_bytes(None, Transform.NONE).upper()
+
+        _secure_dictionary_bytes.cache_clear()
+        to_alphanumeric(1, secure_key="secret", transform=Transform.UPPER)
+        to_alphanumeric(2, secure_key="secret", transform=Transform.UPPER)
+        info = _secure_dictionary_bytes.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_invalid_transform_in_public_api(self) -> None:
+        """Test that an invalid transform raises with and without a key."""
+        with pytest.raises(ConverterError, match="Invalid transform type"):
+            to_alphanumeric(1, transform="invalid")  # type: ignore[arg-type]
+        with pytest.raises(ConverterError, match="Invalid transform type"):
+            to_alphanumeric(
+                1,
+                secure_key="secret",
+                transform="invalid",  # type: ignore[arg-type]
+            )
+
+    def test_index_cache_matches_dictionary_cache(self) -> None:
+        """Test that the decode index cache holds as many keys as the dictionary."""
+        from yid_py.converter import _build_index, _secure_dictionary
+
+        index_size = _build_index.cache_info().maxsize
+        assert index_size == _secure_dictionary.cache_info().maxsize
+
+    def test_max_digits_is_exact_up_to_64_bits(self) -> None:
+        """Test _max_digits against the real length for 64-bit values."""
+        from yid_py.converter import _max_digits
+
+        for bits in range(1, 65):
+            largest = 2**bits - 1
+            assert _max_digits(largest) == len(to_alphanumeric(largest))
+        assert _max_digits(2**200) >= len(to_alphanumeric(2**200))
+
+    def test_secure_dictionary_is_cached(self) -> None:
+        """Test that _secure_dictionary is computed once per key."""
+        from yid_py.converter import _secure_dictionary
+
+        _secure_dictionary.cache_clear()
+        first = _secure_dictionary("cached-key")
+        second = _secure_dictionary("cached-key")
+        assert first is second
+        assert _secure_dictionary.cache_info().hits == 1
 
 
 class TestEdgeCases:
@@ -286,6 +429,20 @@ class TestEdgeCases:
         decoded = to_numeric(encoded)
         assert decoded == large_num
 
+    def test_powers_of_dict_len(self) -> None:
+        """Test numbers around exact powers of 62."""
+        for power in range(1, 20):
+            boundary = 62**power
+            assert to_alphanumeric(boundary) == "b" + "a" * power
+            assert to_alphanumeric(boundary - 1) == "Z" * power
+            assert to_numeric(to_alphanumeric(boundary + 1)) == boundary + 1
+
+    def test_long_strings(self) -> None:
+        """Test decoding of long alphanumeric strings."""
+        assert to_numeric("b" + "a" * 200) == 62**200
+        assert to_numeric("Z" * 200) == 62**200 - 1
+        assert to_numeric("a" * 50 + "dnh") == 12345
+
     def test_empty_secure_key_treated_as_none(self) -> None:
         """Test that empty string secure key works like None."""
         result_none = to_alphanumeric(12345, secure_key=None)
@@ -29,12 +29,16 @@ from .converter import (
     Transform,
     create,
     to_alphanumeric,
+    to_alphanumeric_batch,
     to_numeric,
+    to_numeric_batch,
 )
 
 __all__ = [
     "to_alphanumeric",
     "to_numeric",
+    "to_alphanumeric_batch",
+    "to_numeric_batch",
     "create",
     "Encoder",
     "Transform",
@@ -7,9 +7,10 @@ Authors:
     Kevin van Zonneveld <kevin@transloadit.com> (https://github.com/kvz)
 """
 
+import functools
 import hashlib
 import math
-import string
+from collections.abc import Iterable, Mapping
 from enum import Enum, auto
 
 
@@ -26,10 +27,35 @@ class Transform(Enum):
     UPPER = auto()
     LOWER = auto()
 
+    # Members compare by identity, so identity hashing is consistent and
+    # avoids Enum's Python-level __hash__ on every lookup table access
+    __hash__ = object.__hash__
+
 
 # Base dictionary: a-z + 0-9 + A-Z (62 characters)
-_DICTIONARY = string.ascii_lowercase + string.digits + string.ascii_uppercase
+_DICTIONARY = "abcdefghijklmnopqrstuvwxyz0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 _DICT_LEN = len(_DICTIONARY)
+_DICTIONARY_BYTES = _DICTIONARY.encode("ascii")
+assert _DICT_LEN == 62
+
+# Maximum base62 digits of a number, indexed by its bit length (up to 64 bits)
+_MAX_DIGITS = tuple(math.ceil(b / math.log2(_DICT_LEN)) or 1 for b in range(65))
+_MAX_SIZED_NUMBER = 1 << 64
+
+# Case transformations as ASCII translation tables (None means no change)
+_TRANSFORMS: dict[Transform, bytes | None] = {
+    Transform.NONE: None,
+    Transform.UPPER: bytes.maketrans(_DICTIONARY_BYTES[:26], _DICTIONARY_BYTES[36:]),
+    Transform.LOWER: bytes.maketrans(_DICTIONARY_BYTES[36:], _DICTIONARY_BYTES[:26]),
+}
+
+# Base dictionary bytes with each case transformation already applied
+_TRANSFORMED_DICTIONARY_BYTES = {
+    transform: _DICTIONARY_BYTES
+    if table is None
+    else _DICTIONARY_BYTES.translate(table)
+    for transform, table in _TRANSFORMS.items()
+}
 
 
 def to_alphanumeric(
@@ -56,9 +82,11 @@ def to_alphanumeric(
         >>> to_alphanumeric(12345, transform=Transform.UPPER)
         'DNH'
     """
-    dictionary = _secure_dictionary(secure_key) if secure_key else _DICTIONARY
-    result = _num_to_alpha(number, dictionary, pad_up)
-    return _apply_transform(result, transform)
+    if not secure_key and pad_up <= 1 and transform is Transform.NONE:
+        return _DEFAULT_ENCODER.encode_raw(number)
+
+    dictionary = _dictionary_bytes(secure_key, transform)
+    return _num_to_alpha(number, dictionary, _pad_offset(pad_up))
 
 
 def to_numeric(
@@ -79,8 +107,64 @@ def to_numeric(
         >>> to_numeric('dnh')
         12345
     """
+    if not secure_key and pad_up <= 1:
+        return _DEFAULT_ENCODER.decode(alphanumeric)
+
     dictionary = _secure_dictionary(secure_key) if secure_key else _DICTIONARY
-    return _alpha_to_num(alphanumeric, dictionary, pad_up)
+    return _alpha_to_num(alphanumeric, _build_index(dictionary), _pad_offset(pad_up))
+
+
+def to_alphanumeric_batch(
+    numbers: Iterable[int],
+    pad_up: int = 0,
+    secure_key: str | None = None,
+    transform: Transform = Transform.NONE,
+) -> list[str]:
+    """
+    Convert many numbers to alphanumeric strings at once.
+
+    The dictionary and padding are resolved once for the whole batch.
+
+    Args:
+        numbers: The numbers to convert.
+        pad_up: Padding value for the conversion.
+        secure_key: Optional key to shuffle the dictionary.
+        transform: Case transformation (NONE, UPPER, LOWER).
+
+    Returns:
+        The alphanumeric strings, in input order.
+
+    Example:
+        >>> to_alphanumeric_batch([0, 61, 12345])
+        ['a', 'Z', 'dnh']
+    """
+    dictionary = _dictionary_bytes(secure_key, transform)
+    pad_offset = _pad_offset(pad_up)
+    return [_num_to_alpha(number, dictionary, pad_offset) for number in numbers]
+
+
+def to_numeric_batch(
+    alphanumerics: Iterable[str], pad_up: int = 0, secure_key: str | None = None
+) -> list[int]:
+    """
+    Convert many alphanumeric strings back to numbers at once.
+
+    Args:
+        alphanumerics: The alphanumeric strings to convert.
+        pad_up: Padding value (must match the value used for encoding).
+        secure_key: Optional key (must match the key used for encoding).
+
+    Returns:
+        The numeric values, in input order.
+
+    Example:
+        >>> to_numeric_batch(['a', 'Z', 'dnh'])
+        [0, 61, 12345]
+    """
+    dictionary = _secure_dictionary(secure_key) if secure_key else _DICTIONARY
+    index = _build_index(dictionary)
+    pad_offset = _pad_offset(pad_up)
+    return [_alpha_to_num(value, index, pad_offset) for value in alphanumerics]
 
 
 class Encoder:
@@ -102,9 +186,16 @@ class Encoder:
         transform: Transform = Transform.NONE,
     ):
         self._pad_up = pad_up
+        self._pad_offset = _pad_offset(pad_up)
+        # Output buffer size for any 64-bit number, larger ones are sized per call
+        self._max_digits = _max_digits(_MAX_SIZED_NUMBER - 1 + self._pad_offset)
         self._secure_key = secure_key
         self._transform = transform
         self._dictionary = _secure_dictionary(secure_key) if secure_key else _DICTIONARY
+        self._dictionary_bytes = _dictionary_bytes(secure_key, Transform.NONE)
+        self._index = _build_index(self._dictionary)
+        # Resolved on first encode(), so an invalid transform only fails there
+        self._transformed_bytes: bytes | None = None
 
     def encode(self, number: int) -> str:
         """
@@ -113,12 +204,18 @@ class Encoder:
         Returns the transformed result (if transform was set).
         For the raw (non-transformed) result, use encode_raw().
         """
-        result = _num_to_alpha(number, self._dictionary, self._pad_up)
-        return _apply_transform(result, self._transform)
+        dictionary = self._transformed_bytes
+        if dictionary is None:
+            dictionary = _dictionary_bytes(self._secure_key, self._transform)
+            self._transformed_bytes = dictionary
+
+        size = self._max_digits if number < _MAX_SIZED_NUMBER else 0
+        return _num_to_alpha(number, dictionary, self._pad_offset, size)
 
     def encode_raw(self, number: int) -> str:
         """Convert a number to an alphanumeric string without transform."""
-        return _num_to_alpha(number, self._dictionary, self._pad_up)
+        size = self._max_digits if number < _MAX_SIZED_NUMBER else 0
+        return _num_to_alpha(number, self._dictionary_bytes, self._pad_offset, size)
 
     def decode(self, alphanumeric: str) -> int:
         """
@@ -126,7 +223,7 @@ class Encoder:
 
         Expects the raw (non-transformed) value from encode_raw().
         """
-        return _alpha_to_num(alphanumeric, self._dictionary, self._pad_up)
+        return _alpha_to_num(alphanumeric, self._index, self._pad_offset)
 
 
 def create(
@@ -156,6 +253,7 @@ def create(
 # --- Private functions ---
 
 
+@functools.lru_cache(maxsize=1024)
 def _secure_dictionary(secure_key: str) -> str:
     """
     Shuffle the dictionary based on a secure key.
@@ -163,64 +261,118 @@ def _secure_dictionary(secure_key: str) -> str:
     This makes it harder to calculate the corresponding numeric ID
     without knowing the key.
     """
-    sha256_hash = hashlib.sha256(secure_key.encode()).hexdigest()
-    secure_hash = (
-        hashlib.sha512(secure_key.encode()).hexdigest()
-        if len(sha256_hash) < _DICT_LEN
-        else sha256_hash
-    )
+    # A SHA-256 hex digest is 64 characters, enough for all 62 positions
+    secure_hash = hashlib.sha256(secure_key.encode()).hexdigest()
+
+    # Stable sort: positions with equal hash characters keep dictionary order
+    order = sorted(range(_DICT_LEN), key=secure_hash.__getitem__, reverse=True)
+
+    return "".join([_DICTIONARY[i] for i in order])
+
+
+def _dictionary_bytes(secure_key: str | None, transform: Transform) -> bytes:
+    """ASCII bytes of the encoding dictionary with the case transform applied."""
+    if secure_key:
+        return _secure_dictionary_bytes(secure_key, transform)
+
+    try:
+        return _TRANSFORMED_DICTIONARY_BYTES[transform]
+    except KeyError:
+        raise ConverterError(f"Invalid transform type: {transform}") from None
+
+
+@functools.lru_cache(maxsize=1024)
+def _secure_dictionary_bytes(secure_key: str, transform: Transform) -> bytes:
+    """ASCII bytes of the shuffled dictionary with the case transform applied."""
+    return _apply_transform(_secure_dictionary(secure_key).encode("ascii"), transform)
+
+
+def _pad_offset(pad_up: int) -> int:
+    """Offset added to numbers to pad the output up to pad_up characters."""
+    return _DICT_LEN ** (pad_up - 1) if pad_up > 1 else 0
+
+
+def _max_digits(number: int) -> int:
+    """Upper bound of base62 digits needed for a positive number."""
+    bits = number.bit_length()
+    if bits < len(_MAX_DIGITS):
+        return _MAX_DIGITS[bits]
 
-    paired = sorted(
-        zip(secure_hash[:_DICT_LEN], _DICTIONARY, strict=True),
-        key=lambda x: x[0],
-        reverse=True,
-    )
+    # log2(62) > 5, so bits // 5 + 1 always leaves enough room
+    return bits // 5 + 1
 
-    return "".join(char for _, char in paired)
 
+def _num_to_alpha(
+    number: int, dictionary: bytes, pad_offset: int = 0, size: int = 0
+) -> str:
+    """
+    Convert number to alphanumeric string.
+
+    A non-zero size must be large enough for the padded number.
+    """
+    original = number
+    number += pad_offset
 
-def _num_to_alpha(number: int, dictionary: str, pad_up: int = 0) -> str:
-    """Convert number to alphanumeric string."""
-    if pad_up > 1:
-        number += _DICT_LEN ** (pad_up - 1)
+    if number < 0:
+        raise ConverterError(f"Cannot convert negative number: {original}")
 
-    if number == 0:
-        return dictionary[0]
+    if number < _DICT_LEN:
+        return dictionary[number : number + 1].decode("ascii")
 
-    output = []
-    t = int(math.log(number, _DICT_LEN))
+    size = size or _max_digits(number)
+    buffer = bytearray(size)
+    pos = size
 
-    while t >= 0:
-        bcp = _DICT_LEN**t
-        index = (number // bcp) % _DICT_LEN
-        output.append(dictionary[index])
-        number -= index * bcp
-        t -= 1
+    while number:
+        number, index = divmod(number, _DICT_LEN)
+        pos -= 1
+        buffer[pos] = dictionary[index]
 
-    return "".join(output)
+    return buffer[pos:].decode("ascii")
 
 
-def _alpha_to_num(alphanumeric: str, dictionary: str, pad_up: int = 0) -> int:
-    """Convert alphanumeric string to number."""
+def _alpha_to_num(
+    alphanumeric: str, index: Mapping[str, int], pad_offset: int = 0
+) -> int:
+    """Convert alphanumeric string to number using a _build_index() table."""
     result = 0
 
-    for i, char in enumerate(reversed(alphanumeric)):
-        result += dictionary.index(char) * (_DICT_LEN**i)
+    try:
+        if len(alphanumeric) == 1:
+            return index[alphanumeric] - pad_offset
+
+        for char in alphanumeric:
+            result = result * _DICT_LEN + index[char]
+    except KeyError as e:
+        raise ConverterError(f"Invalid character: {e.args[0]!r}") from None
+
+    return result - pad_offset
+
 
-    if pad_up > 1:
-        result -= _DICT_LEN ** (pad_up - 1)
+@functools.lru_cache(maxsize=1024)
+def _build_index(dictionary: str) -> Mapping[str, int]:
+    """
+    Map each dictionary character to its digit value.
+
+    The mapping is cached and shared between callers, so it must not be mutated.
+    """
+    return {char: value for value, char in enumerate(dictionary)}
+
+
+def _apply_transform(value: bytes, transform: Transform) -> bytes:
+    """
+    Apply case transformation to ASCII bytes.
+
+    Encoding applies it to the dictionary itself, so every character
+    produced from the transformed dictionary is already in the right case.
+    """
+    try:
+        table = _TRANSFORMS[transform]
+    except KeyError:
+        raise ConverterError(f"Invalid transform type: {transform}") from None
 
-    return result
+    return value if table is None else value.translate(table)
 
 
-def _apply_transform(value: str, transform: Transform) -> str:
-    """Apply case transformation."""
-    match transform:
-        case Transform.NONE:
-            return value
-        case Transform.UPPER:
-            return value.upper()
-        case Transform.LOWER:
-            return value.lower()
-        case _:
-            raise ConverterError(f"Invalid transform type: {transform}")
+# Shared encoder for calls without options (it holds no mutable state)
+_DEFAULT_ENCODER = Encoder()